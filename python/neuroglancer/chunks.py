@@ -31,9 +31,9 @@ def encode_jpeg(subvol):
 def encode_npz(subvol):
     fileobj = io.BytesIO()
     np.save(fileobj, np.asfortranarray(subvol))
-    cdz = zlib.compress(fileobj.getvalue())
+    cdz = zlib.compress(fileobj.getbuffer())
     return cdz
 
 
 def encode_raw(subvol):
-    return subvol.tostring('C')
+    return subvol.tobytes('C')
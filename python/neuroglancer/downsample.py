@@ -14,7 +14,7 @@
 
 from __future__ import division
 
-import math
+import itertools
 
 import numpy as np
 
@@ -25,15 +25,23 @@ def downsample_with_averaging(array, factor):
     @return: The downsampled array, of the same type as x.
     """
     factor = tuple(factor)
-    output_shape = tuple(int(math.ceil(s / f)) for s, f in zip(array.shape, factor))
-    temp = np.zeros(output_shape, dtype=np.float32)
-    counts = np.zeros(output_shape, np.int)
-    for offset in np.ndindex(factor):
+    output_shape = tuple(-(-s // f) for s, f in zip(array.shape, factor))
+    # The part at offset (0, ..., 0) covers the entire output, so it initializes the accumulator
+    # in place of a zero fill.
+    temp = np.array(array[tuple(np.s_[::f] for f in factor)], dtype=np.float32)
+    for offset in itertools.islice(np.ndindex(factor), 1, None):
         part = array[tuple(np.s_[o::f] for o, f in zip(offset, factor))]
         indexing_expr = tuple(np.s_[:s] for s in part.shape)
         temp[indexing_expr] += part
-        counts[indexing_expr] += 1
-    return np.cast[array.dtype](temp / counts)
+    # The number of input elements averaged into each output element is separable: along each
+    # dimension it is `f` except possibly for the last, partial, block.
+    counts = 1
+    for i, (s, f) in enumerate(zip(array.shape, factor)):
+        counts_shape = [1] * len(output_shape)
+        counts_shape[i] = output_shape[i]
+        counts = counts * np.minimum(f, s - np.arange(output_shape[i]) * f).reshape(counts_shape)
+    # The division is done in float64, as `temp` is only single precision.
+    return np.true_divide(temp, counts, dtype=np.float64).astype(array.dtype, copy=False)
 
 
 def downsample_with_striding(array, factor):
@@ -58,6 +58,7 @@ class GoogleApplicationDefaultCredentialsProvider(credentials_provider.Credentia
 
         self._lock = threading.Lock()
         self._credentials = None
+        self._request = None
 
     def get_new(self):
         def func():
@@ -68,10 +69,12 @@ class GoogleApplicationDefaultCredentialsProvider(credentials_provider.Credentia
                     del project
                     self._credentials = credentials
                 if not self._credentials.valid:
-                    import google.auth.transport.requests
-                    import requests
-                    request = google.auth.transport.requests.Request()
-                    self._credentials.refresh(request)
+                    if self._request is None:
+                        # Reuse the same HTTP session for all refreshes to avoid a new
+                        # connection (and TLS handshake) each time the token expires.
+                        import google.auth.transport.requests
+                        self._request = google.auth.transport.requests.Request()
+                    self._credentials.refresh(self._request)
                 return dict(tokenType=u'Bearer', accessToken=self._credentials.token)
 
         return run_on_new_thread(func)
@@ -15,33 +15,67 @@
 from __future__ import absolute_import
 
 import collections
+import functools
 import json
 import numbers
 
 import numpy as np
 
-from . import local_volume
-
 min_safe_integer = -9007199254740991
 max_safe_integer = 9007199254740991
 
-def json_encoder_default(obj):
-    """JSON encoder function that handles some numpy types."""
-    if isinstance(obj, numbers.Integral) and (obj < min_safe_integer or obj > max_safe_integer):
-        return str(obj)
-    if isinstance(obj, np.integer):
+def _encode_integral(obj):
+    if obj < min_safe_integer or obj > max_safe_integer:
         return str(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return list(obj)
-    elif isinstance(obj, (set, frozenset)):
-        return list(obj)
     raise TypeError
 
+
+def _encode_ndarray(obj):
+    # Integer elements are encoded as strings, like integer scalars, to avoid loss of precision for
+    # uint64 values.
+    if obj.dtype.kind in 'iu':
+        return obj.astype(str).tolist()
+    return obj.tolist()
+
+
+def _get_json_encoder_default_handler(obj_type):
+    if issubclass(obj_type, np.integer):
+        return str
+    if issubclass(obj_type, numbers.Integral):
+        return _encode_integral
+    if issubclass(obj_type, np.floating):
+        return float
+    if issubclass(obj_type, np.ndarray):
+        return _encode_ndarray
+    if issubclass(obj_type, (set, frozenset)):
+        return list
+    return None
+
+
+# Maps each type passed to `json_encoder_default` to its handler (or `None` if unsupported), so
+# that the `issubclass` checks are only done once per type.
+_json_encoder_default_handlers = {}
+
+
+def json_encoder_default(obj):
+    """JSON encoder function that handles some numpy types."""
+    obj_type = type(obj)
+    try:
+        handler = _json_encoder_default_handlers[obj_type]
+    except KeyError:
+        handler = _json_encoder_default_handlers[obj_type] = _get_json_encoder_default_handler(
+            obj_type)
+    if handler is None:
+        raise TypeError
+    return handler(obj)
+
+@functools.singledispatch
 def json_encoder_default_for_repr(obj):
-    if isinstance(obj, local_volume.LocalVolume):
-        return '<LocalVolume>'
+    """JSON encoder function used for `repr`.
+
+    Additional types with a compact representation (such as `LocalVolume`) are registered by the
+    modules that define them.
+    """
     return json_encoder_default(obj)
 
 def decode_json(x):
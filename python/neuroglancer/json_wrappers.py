@@ -39,6 +39,25 @@ def to_json(value):
     return method()
 
 
+class _NoLock(object):
+    """Stand-in for `threading.RLock` used by readonly wrappers.
+
+    Readonly wrappers are never modified, other than to cache wrapped values.  Concurrent cache
+    misses for the same key may construct the wrapped value more than once, which is harmless, so
+    no locking is needed.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_no_lock = _NoLock()
+
+
 class JsonObjectWrapper(object):
     supports_readonly = True
 
@@ -53,11 +72,15 @@ class JsonObjectWrapper(object):
             raise TypeError
         object.__setattr__(self, '_json_data', json_data)
         object.__setattr__(self, '_cached_wrappers', dict())
-        object.__setattr__(self, '_lock', threading.RLock())
-        object.__setattr__(self, '_readonly', 1 if _readonly else False)
+        object.__setattr__(self, '_lock', _no_lock if _readonly else threading.RLock())
+        # While assigning `kwargs` to a readonly wrapper, `_readonly` is temporarily set to `1`,
+        # which is truthy but permitted by `_set_wrapped`.
+        initialize_readonly = _readonly and kwargs
+        object.__setattr__(self, '_readonly', 1 if initialize_readonly else _readonly)
         for k in kwargs:
             setattr(self, k, kwargs[k])
-        object.__setattr__(self, '_readonly', _readonly)
+        if initialize_readonly:
+            object.__setattr__(self, '_readonly', _readonly)
 
     def to_json(self):
         if self._readonly:
@@ -75,7 +98,17 @@ class JsonObjectWrapper(object):
         return type(self)(copy.deepcopy(self.to_json(), memo))
 
     def __eq__(self, other):
-        return type(self) == type(other) and self.to_json() == other.to_json()
+        if self is other:
+            return True
+        if type(self) != type(other):
+            return False
+        if (type(self).to_json is JsonObjectWrapper.to_json and not self._cached_wrappers
+                and not other._cached_wrappers):
+            # Neither side has wrapped values that may have been modified, so the backing dicts can
+            # be compared directly without building copies.  Subclasses that override `to_json`
+            # (e.g. `ManagedLayer`) may hold state outside the backing dict and are excluded.
+            return self._json_data == other._json_data
+        return self.to_json() == other.to_json()
 
     def __repr__(self):
         return u'%s(%s)' % (type(self).__name__, encode_json_for_repr(self.to_json()))
@@ -133,15 +166,17 @@ def array_wrapper(dtype, shape=None):
             shape = (shape, )
         else:
             shape = tuple(shape)
+        # Only the dimensions with a fixed size need to be checked.
+        fixed_sizes = tuple((i, size) for i, size in enumerate(shape) if size is not None)
 
     def wrapper(value, _readonly=False):
         value = np.array(value, dtype=dtype)
         if _readonly:
             value.setflags(write=False)
         if shape is not None:
-            if len(shape) != len(value.shape) or any(
-                    expected_size is not None and expected_size != actual_size
-                    for expected_size, actual_size in zip(shape, value.shape)):
+            actual_shape = value.shape
+            if len(actual_shape) != len(shape) or any(actual_shape[i] != size
+                                                      for i, size in fixed_sizes):
                 raise ValueError('expected shape', shape)
         return value
 
@@ -323,19 +358,37 @@ def typed_map(key_type, value_type, key_validator=None, value_validator=None):
 
 
 def typed_set(wrapped_type):
+    supports_readonly = hasattr(wrapped_type, 'supports_readonly')
+
     def wrapper(x, _readonly=False):
         set_type = frozenset if _readonly else set
-        kwargs = dict()
-        if hasattr(wrapped_type, 'supports_readonly'):
-            kwargs.update(_readonly=True)
         if x is None:
             return set_type()
-        return set_type(wrapped_type(v, **kwargs) for v in x)
+        if supports_readonly:
+            return set_type(wrapped_type(v, _readonly=True) for v in x)
+        return set_type(map(wrapped_type, x))
     wrapper.supports_readonly = True
     return wrapper
 
+def _int_list_from_array(x):
+    if x.dtype.kind == 'b':
+        x = x.astype(np.int64)
+    return x.tolist()
+
+
+# Vectorized equivalents of applying a numeric scalar validator to each element of a 1-d ndarray,
+# as `(supported dtype kinds, conversion function)`.  Only dtype kinds for which the result is
+# identical to the per-element conversion are supported.
+_numeric_array_validators = {
+    float: ('biuf', lambda x: x.astype(np.float64).tolist()),
+    int: ('biu', _int_list_from_array),
+    np.uint64: ('bu', lambda x: list(x.astype(np.uint64))),
+}
+
+
 def typed_list(wrapped_type, validator=None):
     validator = _normalize_validator(wrapped_type, validator)
+    array_validator = _numeric_array_validators.get(validator)
     class TypedList(object):
         supports_readonly = True
         supports_validation = True
@@ -347,6 +400,13 @@ def typed_list(wrapped_type, validator=None):
             if not isinstance(json_data, (list, tuple, np.ndarray)):
                 raise ValueError
             self._readonly = _readonly
+            if isinstance(json_data, np.ndarray) and array_validator is not None:
+                kinds, convert = array_validator
+                if json_data.ndim == 1 and json_data.dtype.kind in kinds:
+                    self._data = convert(json_data)
+                    return
+            # Other validators must see the original numpy scalars (e.g. `number_or_string` passes
+            # np.uint64 values through so that they are encoded as strings).
             self._data = [validator(x) for x in json_data]
 
         def __len__(self):
@@ -24,10 +24,18 @@ import six
 from . import downsample, downsample_scales
 from .chunks import encode_jpeg, encode_npz, encode_raw
 from .coordinate_space import CoordinateSpace
+from .json_utils import json_encoder_default_for_repr
 from . import trackable_state
 from .random_token import make_random_token
 
 
+_ENCODERS = {
+    'jpeg': (encode_jpeg, 'image/jpeg'),
+    'npz': (encode_npz, 'application/octet-stream'),
+    'raw': (encode_raw, 'application/octet-stream'),
+}
+
+
 class MeshImplementationNotAvailable(Exception):
     pass
 
@@ -158,17 +166,22 @@ class LocalVolume(trackable_state.ChangeNotifier):
         rank = self.rank
         if len(start) != rank or len(end) != rank:
             raise ValueError('Invalid request')
+        try:
+            encoder, content_type = _ENCODERS[data_format]
+        except KeyError:
+            raise ValueError('Invalid data format requested.')
         downsample_factor = np.array(scale_key.split(','), dtype=np.int64)
         if (len(downsample_factor) != rank or np.any(downsample_factor < 1)
             or np.any(downsample_factor > self.max_downsampling)
             or np.prod(downsample_factor) > self.max_downsampling):
             raise ValueError('Invalid downsampling factor.')
-        downsampled_shape = np.cast[np.int64](np.ceil(self.shape / downsample_factor))
+        downsampled_shape = -(-np.array(self.shape, dtype=np.int64) // downsample_factor)
         if np.any(end < start) or np.any(start < 0) or np.any(end > downsampled_shape):
             raise ValueError('Out of bounds data request.')
 
-        indexing_expr = tuple(np.s_[start[i] * downsample_factor[i]:end[i] * downsample_factor[i]]
-                              for i in range(rank))
+        source_start = start * downsample_factor
+        source_end = end * downsample_factor
+        indexing_expr = tuple(np.s_[a:b] for a, b in zip(source_start, source_end))
         subvol = np.array(self.data[indexing_expr], copy=False)
         if subvol.dtype == 'float64':
             subvol = np.cast[np.float32](subvol)
@@ -178,17 +191,7 @@ class LocalVolume(trackable_state.ChangeNotifier):
                 subvol = downsample.downsample_with_averaging(subvol, downsample_factor)
             else:
                 subvol = downsample.downsample_with_striding(subvol, downsample_factor)
-        content_type = 'application/octet-stream'
-        if data_format == 'jpeg':
-            data = encode_jpeg(subvol)
-            content_type = 'image/jpeg'
-        elif data_format == 'npz':
-            data = encode_npz(subvol)
-        elif data_format == 'raw':
-            data = encode_raw(subvol)
-        else:
-            raise ValueError('Invalid data format requested.')
-        return data, content_type
+        return encoder(subvol), content_type
 
     def get_object_mesh(self, object_id):
         mesh_generator = self._get_mesh_generator()
@@ -244,3 +247,8 @@ class LocalVolume(trackable_state.ChangeNotifier):
             self._mesh_generator_pending = None
             self._mesh_generator = None
         self._dispatch_changed_callbacks()
+
+
+@json_encoder_default_for_repr.register(LocalVolume)
+def _local_volume_json_encoder_default_for_repr(obj):
+    return '<LocalVolume>'
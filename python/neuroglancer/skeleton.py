@@ -41,8 +41,10 @@ class Skeleton(object):
         vertex_positions = self.vertex_positions
         vertex_attributes = self.vertex_attributes
         result.write(struct.pack('<II', vertex_positions.shape[0], edges.shape[0]))
-        result.write(vertex_positions.tobytes())
-        result.write(edges.tobytes())
+        # Write the array buffers directly rather than via `tobytes()` to avoid
+        # an intermediate copy of each array.
+        result.write(np.ascontiguousarray(vertex_positions))
+        result.write(np.ascontiguousarray(edges))
         if len(source.vertex_attributes) > 0:
             for name, info in six.iteritems(source.vertex_attributes):
 
@@ -53,7 +55,7 @@ class Skeleton(object):
                         attribute.size != np.prod(expected_shape)):
                     raise ValueError('Expected attribute %r to have shape %r, but was: %r' %
                                      (name, expected_shape, attribute.shape))
-                result.write(attribute.tobytes())
+                result.write(np.ascontiguousarray(attribute))
         return result.getvalue()
 
 
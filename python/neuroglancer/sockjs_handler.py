@@ -82,10 +82,10 @@ class StateHandler(object):
 
     def _on_state_changed(self):
         """Invoked when the viewer state changes."""
-        raw_state, generation = self.state.raw_state_and_generation
+        encoded_state, generation = self.state.encoded_raw_state_and_generation
         if generation != self._last_generation:
             self._last_generation = generation
-            self._send_update(raw_state, generation)
+            self._send_update(encoded_state, generation)
 
     def request_send_state(self, generation):
         if self._send_update is not None:
@@ -144,11 +144,13 @@ class SockJSHandler(sockjs.tornado.SockJSConnection):
                 credentials_manager=default_credentials_manager)
 
         def make_state_handler(key, state, send_updates, receive_updates):
-            def send_update(raw_state, generation):
+            def send_update(encoded_state, generation):
                 if not self.is_open:
                     return
-                message = {'t': 'setState', 'k': key, 's': raw_state, 'g': generation}
-                self.send(encode_json(message))
+                # The state is already encoded (and shared by all clients), so splice it into the
+                # message rather than re-encoding it for each connection.
+                self.send(u'{"t": "setState", "k": %s, "s": %s, "g": %s}' %
+                          (encode_json(key), encoded_state, encode_json(generation)))
 
             handler = StateHandler(
                 state=state,
@@ -381,10 +381,10 @@ class MultiCapturer:
                 depth_array_part = self.depth_array[tile_selector]
                 mask = np.logical_and(np.logical_or(tile_depth != 0, depth_array_part == 0),
                                       tile_depth >= depth_array_part)
-                depth_array_part[mask] = tile_depth[mask]
+                np.copyto(depth_array_part, tile_depth, where=mask)
+                np.copyto(self.image_array[tile_selector], tile_image, where=mask[..., np.newaxis])
             else:
-                mask = Ellipsis
-            self.image_array[tile_selector][mask] = tile_image[mask]
+                np.copyto(self.image_array[tile_selector], tile_image)
             self._processed.add(self._get_description(params))
             self._num_states_processed += 1
             elapsed = time.time() - self._start_time
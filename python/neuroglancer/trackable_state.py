@@ -18,6 +18,7 @@ import contextlib
 import copy
 import threading
 
+from .json_utils import encode_json
 from .random_token import make_random_token
 
 
@@ -55,6 +56,7 @@ class TrackableState(ChangeNotifier):
         self._lock = threading.RLock()
         self._generation = make_random_token()
         self._wrapped_state = None
+        self._encoded_raw_state = None
         self._wrapper_type = wrapper_type
         if transform_state is None:
             def transform_state_function(new_state):
@@ -74,6 +76,7 @@ class TrackableState(ChangeNotifier):
                     generation = make_random_token()
                 self._raw_state = new_state
                 self._wrapped_state = None
+                self._encoded_raw_state = None
                 self._generation = generation
                 self._dispatch_changed_callbacks()
             return self._generation
@@ -88,6 +91,19 @@ class TrackableState(ChangeNotifier):
         with self._lock:
             return (self.raw_state, self.state_generation)
 
+    @property
+    def encoded_raw_state_and_generation(self):
+        """Returns the JSON-encoded raw state and the generation.
+
+        The encoding is cached until the state changes, so that it is only computed once regardless
+        of the number of connected clients.
+        """
+        with self._lock:
+            encoded_state = self._encoded_raw_state
+            if encoded_state is None:
+                encoded_state = self._encoded_raw_state = encode_json(self._raw_state)
+            return (encoded_state, self._generation)
+
     @property
     def state_generation(self):
         return self._generation
@@ -33,6 +33,12 @@ DOUBLE_OR_SINGLE_QUOTE_STRING_PATTERN = DOUBLE_QUOTE_STRING_PATTERN + u'|' + SIN
 DOUBLE_QUOTE_PATTERN = u'^((?:[^"\'\\\\]|(?:\\\\.))*)"'
 SINGLE_QUOTE_PATTERN = u'^((?:[^"\'\\\\]|(?:\\\\.))*)\''
 
+_SINGLE_OR_DOUBLE_QUOTE_STRING_REGEX = re.compile(SINGLE_OR_DOUBLE_QUOTE_STRING_PATTERN)
+_DOUBLE_OR_SINGLE_QUOTE_STRING_REGEX = re.compile(DOUBLE_OR_SINGLE_QUOTE_STRING_PATTERN)
+_DOUBLE_QUOTE_REGEX = re.compile(DOUBLE_QUOTE_PATTERN)
+_SINGLE_QUOTE_REGEX = re.compile(SINGLE_QUOTE_PATTERN)
+_COMMA_REGEX = re.compile(u'[&_,]')
+
 
 def _convert_string_literal(x, quote_initial, quote_replace, quote_search):
     if len(x) >= 2 and x[0] == quote_initial and x[-1] == quote_initial:
@@ -53,33 +59,28 @@ def _convert_string_literal(x, quote_initial, quote_replace, quote_search):
 
 
 def _convert_json_helper(x, desired_comma_char, desired_quote_char):
-    comma_search = u'[&_,]'
     if desired_quote_char == u'"':
         quote_initial = u'\''
-        quote_search = DOUBLE_QUOTE_PATTERN
-        string_literal_pattern = SINGLE_OR_DOUBLE_QUOTE_STRING_PATTERN
+        quote_search = _DOUBLE_QUOTE_REGEX
+        string_literal_regex = _SINGLE_OR_DOUBLE_QUOTE_STRING_REGEX
     else:
         quote_initial = u'"'
-        quote_search = SINGLE_QUOTE_PATTERN
-        string_literal_pattern = DOUBLE_OR_SINGLE_QUOTE_STRING_PATTERN
-    s = u''
-    while x:
-        m = re.search(string_literal_pattern, x)
-        if m is None:
-            before = x
-            x = u''
-            replacement = u''
+        quote_search = _SINGLE_QUOTE_REGEX
+        string_literal_regex = _DOUBLE_OR_SINGLE_QUOTE_STRING_REGEX
+    parts = []
+    pos = 0
+    for m in string_literal_regex.finditer(x):
+        parts.append(_COMMA_REGEX.sub(desired_comma_char, x[pos:m.start()]))
+        original_string = m.group(1)
+        if original_string is not None:
+            parts.append(
+                _convert_string_literal(original_string, quote_initial, desired_quote_char,
+                                        quote_search))
         else:
-            before = x[:m.start()]
-            x = x[m.end():]
-            original_string = m.group(1)
-            if original_string is not None:
-                replacement = _convert_string_literal(original_string, quote_initial, desired_quote_char, quote_search)
-            else:
-                replacement = m.group(2)
-        s += re.sub(comma_search, desired_comma_char, before)
-        s += replacement
-    return s
+            parts.append(m.group(2))
+        pos = m.end()
+    parts.append(_COMMA_REGEX.sub(desired_comma_char, x[pos:]))
+    return u''.join(parts)
 
 
 def url_safe_to_json(x):
@@ -23,7 +23,7 @@ import six
 
 from . import local_volume, trackable_state, viewer_config_state, viewer_state
 from . import skeleton
-from .json_utils import decode_json, encode_json, json_encoder_default
+from .json_utils import decode_json, json_encoder_default
 from .random_token import make_random_token
 
 
@@ -202,7 +202,8 @@ class ViewerBase(ViewerCommonBase):
         self.shared_state = trackable_state.TrackableState(viewer_state.ViewerState,
                                                            self._transform_viewer_state)
         self.shared_state.add_changed_callback(
-            lambda: self.volume_manager.update(encode_json(self.shared_state.raw_state)))
+            lambda: self.volume_manager.update(
+                self.shared_state.encoded_raw_state_and_generation[0]))
 
     @property
     def state(self):
@@ -296,6 +296,7 @@ tool.supports_readonly = True
 
 @export
 class SidePanelLocation(JsonObjectWrapper):
+    __slots__ = ()
     side = wrapped_property('side', optional(str))
     visible = wrapped_property('visible', optional(bool))
     size = wrapped_property('size', optional(int))
@@ -306,28 +307,30 @@ class SidePanelLocation(JsonObjectWrapper):
 
 @export
 class SelectedLayerState(SidePanelLocation):
+    __slots__ = ()
     layer = wrapped_property('layer', optional(text_type))
 
 
 @export
 class StatisticsDisplayState(SidePanelLocation):
-    pass
+    __slots__ = ()
 
 
 @export
 class LayerSidePanelState(SidePanelLocation):
+    __slots__ = ()
     tab = wrapped_property('tab', optional(str))
     tabs = wrapped_property('tabs', typed_set(str))
 
 
 @export
 class LayerListPanelState(SidePanelLocation):
-    pass
+    __slots__ = ()
 
 
 @export
 class HelpPanelState(SidePanelLocation):
-    pass
+    __slots__ = ()
 
 
 @export
@@ -430,6 +433,7 @@ class _AnnotationLayerOptions(object):
 
 @export
 class InvlerpParameters(JsonObjectWrapper):
+    __slots__ = ()
     range = wrapped_property('range', optional(array_wrapper(numbers.Number, 2)))
     window = wrapped_property('window', optional(array_wrapper(numbers.Number, 2)))
     channel = wrapped_property('channel', optional(typed_list(int)))
@@ -1014,6 +1018,8 @@ class CrossSection(JsonObjectWrapper):
 
 @export
 class CrossSectionMap(typed_string_map(CrossSection)):
+    __slots__ = ()
+
     @staticmethod
     def interpolate(a, b, t):
         c = copy.deepcopy(a)
@@ -0,0 +1,57 @@
+# @license
+# Copyright 2020 Google Inc.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from neuroglancer import downsample
+import numpy as np
+import pytest
+
+
+def _reference_downsample_with_averaging(array, factor):
+    # Sums each block in float32, in the same order as `downsample_with_averaging`, and divides in
+    # float64.
+    output_shape = tuple((s + f - 1) // f for s, f in zip(array.shape, factor))
+    result = np.zeros(output_shape, dtype=array.dtype)
+    for index in np.ndindex(output_shape):
+        block = array[tuple(np.s_[i * f:(i + 1) * f] for i, f in zip(index, factor))]
+        total = np.float32(0)
+        for value in block.ravel():
+            total = np.float32(float(total) + float(value))
+        result[index] = np.float64(total) / block.size
+    return result
+
+
+def _random_array(rng, shape, dtype):
+    if np.dtype(dtype).kind == 'f':
+        return (rng.randn(*shape) * 1e9).astype(dtype)
+    info = np.iinfo(dtype)
+    return rng.randint(info.min, info.max + 1, size=shape, dtype=np.int64).astype(dtype)
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.int16, np.int32, np.uint32, np.float32, np.float64])
+@pytest.mark.parametrize('shape,factor', [
+    ((7, ), (2, )),
+    ((5, 6), (2, 4)),
+    ((9, 4, 5), (3, 1, 2)),
+    ((3, 5, 4, 2), (2, 2, 3, 1)),
+    ((2, 3), (4, 4)),
+])
+def test_downsample_with_averaging(dtype, shape, factor):
+    rng = np.random.RandomState(0)
+    array = _random_array(rng, shape, dtype)
+    expected = _reference_downsample_with_averaging(array, factor)
+    result = downsample.downsample_with_averaging(array, factor)
+    assert result.dtype == array.dtype
+    np.testing.assert_array_equal(result, expected)
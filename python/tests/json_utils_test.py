@@ -0,0 +1,33 @@
+# @license
+# Copyright 2020 Google Inc.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from neuroglancer import json_utils
+import numpy as np
+
+
+def test_encode_json_integer_array():
+    x = np.array([[1, 2], [3, 2**64 - 1]], dtype=np.uint64)
+    assert json_utils.encode_json(x) == '[["1", "2"], ["3", "18446744073709551615"]]'
+
+
+def test_encode_json_float_array():
+    x = np.array([[0.5, 1], [2, 3]], dtype=np.float32)
+    assert json_utils.encode_json(x) == '[[0.5, 1.0], [2.0, 3.0]]'
+
+
+def test_encode_json_scalars():
+    assert (json_utils.encode_json([np.uint64(2**64 - 1), np.float32(0.5)]) ==
+            '["18446744073709551615", 0.5]')
@@ -0,0 +1,50 @@
+# @license
+# Copyright 2020 Google Inc.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from neuroglancer import json_wrappers
+import numpy as np
+import pytest
+
+
+def _test_arrays():
+    yield np.array([True, False, True])
+    for dtype in (np.int8, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        yield np.array([info.min, -3, 0, 7, info.max], dtype=dtype)
+    for dtype in (np.uint8, np.uint32, np.uint64):
+        yield np.array([0, 5, np.iinfo(dtype).max // 3, np.iinfo(dtype).max], dtype=dtype)
+    # Not exactly representable as a float64.
+    yield np.array([2**53 + 1], dtype=np.uint64)
+    for dtype in (np.float16, np.float32, np.float64):
+        yield np.array([0, 1.5, 1024.25, 3], dtype=dtype)
+
+
+@pytest.mark.parametrize('wrapped_type', [int, float, np.uint64])
+@pytest.mark.parametrize('array', list(_test_arrays()), ids=lambda a: a.dtype.name)
+def test_typed_list_numeric_array(wrapped_type, array):
+    if wrapped_type is np.uint64 and array.dtype.kind == 'i':
+        pytest.skip('negative values are not valid uint64 segment ids')
+    expected = [wrapped_type(x) for x in array]
+    result = list(json_wrappers.typed_list(wrapped_type)(array))
+    assert result == expected
+    assert [type(x) for x in result] == [type(x) for x in expected]
+
+
+def test_typed_list_nested_uint64_array():
+    array = np.array([[1, 2], [3, 2**64 - 1]], dtype=np.uint64)
+    result = json_wrappers.typed_list(json_wrappers.typed_list(np.uint64))(array)
+    assert [list(x) for x in result] == [[1, 2], [3, 2**64 - 1]]
+    assert all(type(y) is np.uint64 for x in result for y in x)
@@ -14,8 +14,9 @@
 
 from __future__ import absolute_import
 
-from neuroglancer import viewer_state
+from neuroglancer import json_utils, viewer_state
 import collections
+import json
 import numpy as np
 import pytest
 
@@ -117,3 +118,20 @@ def test_layers():
     layers_rw = viewer_state.Layers(layer_json)
     del layers_rw[:]
     assert layers_rw.to_json() == []
+
+
+def test_annotation_props_uint64_array_encoding():
+    x = viewer_state.PointAnnotation(id='x',
+                                     point=[1, 2, 3],
+                                     props=np.array([2**64 - 1, 7], dtype=np.uint64))
+    assert json.loads(json_utils.encode_json(x.to_json()))['props'] == ['18446744073709551615', '7']
+
+
+def test_managed_layer_equality():
+    a = viewer_state.ManagedLayer('a', viewer_state.ImageLayer(source='precomputed://x'))
+    assert a == viewer_state.ManagedLayer('a', viewer_state.ImageLayer(source='precomputed://x'))
+    assert a != viewer_state.ManagedLayer('b', viewer_state.ImageLayer(source='precomputed://x'))
+    assert a != viewer_state.ManagedLayer('a',
+                                          viewer_state.SegmentationLayer(source='precomputed://y'))
+    assert a != viewer_state.ManagedLayer('b',
+                                          viewer_state.SegmentationLayer(source='precomputed://y'))